@@ -1,9 +1,9 @@
 import streamlit as st
 import pandas as pd
 import time
-from db import init_db, get_db
+from db import init_db, get_db, pool_status
 # REMOVED 'get_debunk_by_post_id' to fix ImportError
-from models import Post, Company, create_post, save_debunk, create_ledger_entry, get_last_ledger_entry, get_unanalysed_posts, get_all_history, add_company, get_all_companies, delete_company
+from models import Post, Company, create_post, save_debunk, create_ledger_entry, get_last_ledger_entry, get_unanalysed_posts, get_all_history, add_company, get_all_companies, delete_company, commit_batch
 from collector_runner import collect_for_company
 from core.analyzer import extract_claim, search_evidence, analyze_claim
 from core.ledger import compute_hash
@@ -25,6 +25,8 @@ if config.OPENAI_API_KEY:
     st.sidebar.success("AI Connected")
 else:
     st.sidebar.error("Missing API Key")
+if config.DEBUG:
+    st.sidebar.caption(f"DB pool: {pool_status()}")
 
 # --- HELPERS ---
 def run_full_analysis(post_id, post_text, brand):
@@ -58,6 +60,7 @@ def run_full_analysis(post_id, post_text, brand):
         last_entry = get_last_ledger_entry(db)
         prev = last_entry.hash if last_entry else "0"*64
         entry = create_ledger_entry(db, debunk.id, compute_hash(prev, {"id": debunk.id}), prev)
+        commit_batch(db)
         
         st.success("Analysis Complete!")
         st.rerun()
@@ -81,6 +84,7 @@ if page == "Manage Companies":
         if submitted and c_name and c_email:
             db = next(get_db())
             add_company(db, c_name, c_email)
+            commit_batch(db)
             st.success(f"Tracking added for {c_name}!")
             st.rerun()
             
@@ -178,6 +182,7 @@ elif page == "New Analysis":
         db = next(get_db())
         # Create dummy post for manual flow
         p = create_post(db, {"platform": "manual", "brand": "Manual", "text": txt, "priority": "High"})
+        commit_batch(db)
         run_full_analysis(p.id, txt, "Manual")
 
 # --- PAGE: HISTORY & LEDGER ---
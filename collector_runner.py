@@ -2,8 +2,8 @@ from collectors.news_collector import collect_from_news
 from collectors.reddit_collector import collect_from_reddit
 from collectors.youtube_collector import collect_from_youtube
 from collectors.web_collector import collect_from_web
-from core.priority import score_priority
-from models import create_post
+from core.priority import score_from_engagement, score_priority_batch
+from models import create_post, commit_batch
 from db import get_db
 import config
 
@@ -25,23 +25,40 @@ def collect_for_company(company_name, risk_keywords):
 
     db = next(get_db())
     saved_count = 0
+    saved_posts = []
 
-    for item in raw_data:
-        # Calculate Priority
-        prio = score_priority(
-            item.get('likes'), 
-            item.get('comments'), 
-            item.get('shares'), 
-            item.get('text')
-        )
-        item['priority'] = prio
+    try:
+        for item in raw_data:
+            # Calculate Priority
+            prio = score_from_engagement(
+                item.get('likes'), 
+                item.get('comments'), 
+                item.get('shares')
+            )
+            item['priority'] = prio
 
-        # --- LOGIC UPDATE: Save ALL posts (Low/Med/High) ---
-        # We removed the 'if prio in [Med, High]' check so you can see everything.
-        post = create_post(db, item)
-        if post:
-            saved_count += 1
-            print(f"   Saved: {item['text'][:30]}... [{prio}]")
+            # --- LOGIC UPDATE: Save ALL posts (Low/Med/High) ---
+            # We removed the 'if prio in [Med, High]' check so you can see everything.
+            post = create_post(db, item)
+            if post:
+                saved_count += 1
+                saved_posts.append(post)
+                print(f"   Saved: {item['text'][:30]}... [{prio}]")
+
+        # One commit for the whole scan instead of one per post
+        commit_batch(db)
+    except Exception:
+        db.rollback()
+        raise
+
+    # Posts are already saved: an incident-scoring failure must not lose them
+    try:
+        # Open / escalate incidents for the whole scan in one pass
+        score_priority_batch(db, saved_posts)
+        commit_batch(db)
+    except Exception as e:
+        db.rollback()
+        print(f"   ❌ Incident scoring failed for {company_name}: {e}")
     
     print(f"   -> Total new posts saved: {saved_count}")
     return saved_count
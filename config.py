@@ -30,6 +30,7 @@ EMAIL_SMTP_SERVER = "smtp.gmail.com"
 EMAIL_SMTP_PORT = 587
 
 # --- APP CONFIG ---
+DEBUG = get_clean_env("NEUROCHAIN_DEBUG").lower() in ("1", "true", "yes")
 BRAND_KEYWORDS = ["NeuroChain", "TechCorp", "AlphaSynergy"]
 RISK_KEYWORDS = [
     "lawsuit", "antitrust", "monopoly", "layoffs", "privacy", 
@@ -1,6 +1,8 @@
+from dataclasses import dataclass
 from datetime import datetime
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
-from models import IncidentEvent
+from models import IncidentEvent, LEDGER_HASH_VERSION_LEGACY
 
 # =========================================================
 # Ledger Event Types (canonical – do not rename later)
@@ -13,6 +15,16 @@ EVENT_RESPONSE_DRAFTED = "response_drafted"
 EVENT_STATUS_CHANGED = "status_changed"
 EVENT_CLOSED = "closed"
 
+# =========================================================
+# Buffered event (not an ORM object)
+# =========================================================
+
+@dataclass(slots=True, frozen=True)
+class PendingEvent:
+    incident_id: int
+    event_type: str
+    description: str
+
 # =========================================================
 # Ledger Writer
 # =========================================================
@@ -25,6 +37,7 @@ class IncidentLedger:
 
     def __init__(self, db_session: Session):
         self.db = db_session
+        self._pending = []
 
     # -----------------------------------------------------
     # Core event writer
@@ -36,15 +49,43 @@ class IncidentLedger:
         event_type: str,
         description: str,
     ):
-        event = IncidentEvent(
-            incident_id=incident_id,
-            event_type=event_type,
-            description=description,
-            created_at=datetime.utcnow(),
+        """
+        Buffers a single event.
+        Nothing is written until flush() is called.
+        """
+        self._pending.append(
+            PendingEvent(incident_id, event_type, description)
         )
 
-        self.db.add(event)
-        self.db.commit()
+    def record_events(self, rows: list):
+        """
+        Writes many events with ONE multi-row INSERT.
+        All rows in a batch share ONE timestamp.
+        Does NOT commit: the caller owns the transaction.
+        """
+        if not rows:
+            return
+
+        now = datetime.utcnow()
+        rows = [{**row, "created_at": row.get("created_at", now)} for row in rows]
+
+        self.db.execute(insert(IncidentEvent), rows)
+
+    def flush(self):
+        """
+        INSERTs all buffered events into the session.
+        Call once per pipeline tick, not per event,
+        then commit with the rest of the caller's batch.
+        """
+        pending, self._pending = self._pending, []
+        self.record_events([
+            {
+                "incident_id": e.incident_id,
+                "event_type": e.event_type,
+                "description": e.description,
+            }
+            for e in pending
+        ])
 
     # -----------------------------------------------------
     # Semantic helpers (use THESE everywhere)
@@ -98,35 +139,73 @@ class IncidentLedger:
 
     def get_timeline(self, incident_id: int):
         """
-        Returns a chronological list of ledger events
-        for an incident.
+        Streams ledger events for an incident
+        in chronological order.
         """
         return (
             self.db.query(IncidentEvent)
             .filter(IncidentEvent.incident_id == incident_id)
-            .order_by(IncidentEvent.created_at.asc())
-            .all()
+            .order_by(IncidentEvent.created_at.asc(), IncidentEvent.id.asc())
+            .yield_per(500)
         )
-# =========================================================
-# BACKWARD-COMPATIBILITY HELPERS
-# =========================================================
-
-import hashlib
-from datetime import datetime
 
+    def get_timeline_rows(self, incident_id: int):
+        """
+        Lightweight timeline for display / JSON output.
+        Returns (event_type, description, created_at) rows,
+        no ORM objects. Use get_timeline() for admin paths.
+        """
+        return self.db.execute(
+            select(
+                IncidentEvent.event_type,
+                IncidentEvent.description,
+                IncidentEvent.created_at,
+            )
+            .where(IncidentEvent.incident_id == incident_id)
+            .order_by(IncidentEvent.created_at.asc(), IncidentEvent.id.asc())
+        ).all()
 # =========================================================
 # BACKWARD-COMPATIBILITY HELPERS
 # =========================================================
 
 import hashlib
 import json
+import orjson
+
+# Canonical JSON: sorted keys, compact, bytes out (C extension).
+# Keys must be str: coercing non-str keys would let {1: x} and
+# {"1": x} hash the same.
+_HASH_JSON_OPTS = orjson.OPT_SORT_KEYS
+
+_GENESIS_PREV = b"\x00" * 32
+
+def _prev_hash_bytes(prev_hash) -> bytes:
+    if not prev_hash:
+        return _GENESIS_PREV
+    try:
+        return bytes.fromhex(prev_hash)
+    except ValueError:
+        # Non-hex legacy value: hash it as text
+        return str(prev_hash).encode("utf-8")
 
 def compute_hash(prev_hash, data) -> str:
     """
-    Legacy-compatible hash function.
+    Current (LEDGER_HASH_VERSION) hash function.
+
+    Chains previous hash + structured data into a
+    deterministic SHA-256 hash: sha256(prev_bytes || json(data)).
+    """
+    h = hashlib.sha256()
+    h.update(_prev_hash_bytes(prev_hash))
+    h.update(orjson.dumps(data, default=str, option=_HASH_JSON_OPTS))
+    return h.hexdigest()
 
-    Combines previous hash + structured data
-    to produce deterministic SHA-256 hash.
+
+def compute_hash_legacy(prev_hash, data) -> str:
+    """
+    Hash format of rows written before hash_version existed
+    (hash_version NULL / LEDGER_HASH_VERSION_LEGACY).
+    Verification only: never use for new entries.
     """
     payload = {
         "prev": prev_hash,
@@ -136,3 +215,55 @@ def compute_hash(prev_hash, data) -> str:
     serialized = json.dumps(payload, sort_keys=True, default=str)
     return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
 
+
+def _is_legacy(entry) -> bool:
+    version = getattr(entry, "hash_version", None)
+    return version is None or version == LEDGER_HASH_VERSION_LEGACY
+
+
+def verify_chain(entries, data_fn=lambda e: {"id": e.debunk_id}):
+    """
+    Verifies a sequence of LedgerEntry rows (oldest first).
+
+    `data_fn(entry)` must return the same data that was passed
+    to compute_hash when the entry was written. Each row is
+    checked with the formula of its own hash_version.
+    Rows written before compute_hash_legacy existed cannot be
+    verified by any formula here; pass only the entries from
+    where verification should start.
+    Returns the first broken entry, or None if the chain is intact.
+    """
+    entries = list(entries)
+
+    # Serialise every current-format payload up front into one buffer
+    buf = bytearray()
+    offsets = []
+    for entry in entries:
+        if _is_legacy(entry):
+            offsets.append(None)
+            continue
+        start = len(buf)
+        buf += orjson.dumps(data_fn(entry), default=str, option=_HASH_JSON_OPTS)
+        offsets.append((start, len(buf)))
+
+    view = memoryview(buf)
+    sha256 = hashlib.sha256
+    expected_prev = None
+
+    for entry, span in zip(entries, offsets):
+        if expected_prev is not None and entry.prev_hash != expected_prev:
+            return entry
+
+        if span is None:
+            digest = compute_hash_legacy(entry.prev_hash, data_fn(entry))
+        else:
+            h = sha256(_prev_hash_bytes(entry.prev_hash))
+            h.update(view[span[0]:span[1]])
+            digest = h.hexdigest()
+
+        if digest != entry.hash:
+            return entry
+
+        expected_prev = entry.hash
+
+    return None
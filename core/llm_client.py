@@ -12,8 +12,11 @@ NO risk logic.
 NO UI logic.
 """
 
-from openai import OpenAI
+import asyncio
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+import httpx
 from datetime import datetime
+from typing import AsyncIterator
 from sqlalchemy.orm import Session
 
 from config import (
@@ -32,6 +35,10 @@ def create_openai_client():
     """
     Create OpenAI client with proper auth context.
     Organization & project are optional but supported.
+
+    The async client's connection pool belongs to the event
+    loop it is used on: create one per burst and close it
+    (`async with create_openai_client() as client:`).
     """
 
     if not OPENAI_API_KEY:
@@ -47,11 +54,31 @@ def create_openai_client():
     if OPENAI_PROJECT_ID:
         client_kwargs["project"] = OPENAI_PROJECT_ID
 
-    return OpenAI(**client_kwargs)
+    # Room for many concurrent drafts in one burst
+    client_kwargs["http_client"] = DefaultAsyncHttpxClient(
+        limits=httpx.Limits(max_connections=50),
+    )
+
+    return AsyncOpenAI(**client_kwargs)
+
 
+# =========================================================
+# Static prompt prefix
+# =========================================================
+# Identical for every incident and always sent first,
+# so the provider's prompt cache can reuse it.
+
+SYSTEM_INSTRUCTIONS = """
+You are assisting a professional public relations team.
 
-# Singleton client
-_openai_client = create_openai_client()
+Your task:
+- Draft a calm, factual, non-defensive response
+- Do NOT speculate
+- Do NOT assign blame
+- Do NOT verify truth
+- Do NOT exaggerate
+- Keep it concise and professional
+"""
 
 
 # =========================================================
@@ -66,48 +93,118 @@ class LLMClient:
     def __init__(self, db_session: Session):
         self.db = db_session
         self.ledger = IncidentLedger(db_session)
+        # Session is not thread-safe: one DB write at a time.
+        # asyncio.Lock binds to a loop, so one lock per loop.
+        self._db_lock = None
+        self._db_lock_loop = None
 
     # -----------------------------------------------------
     # Response drafting
     # -----------------------------------------------------
 
-    def draft_response(
+    async def draft_response(
         self,
         incident,
         context: str,
-    ) -> str:
+        client=None,
+    ) -> AsyncIterator[str]:
         """
-        Generate an AI-assisted response draft.
+        Stream an AI-assisted response draft.
 
-        Side effects:
+        Async-yields text chunks as they arrive (e.g. feed
+        it to st.write_stream). Side effects run once the
+        stream has finished:
         - Sets response_drafted_at
         - Updates incident status
         - Writes ledger event
+
+        Pass `client` to share one connection pool across
+        a burst; otherwise a client is opened for this call.
         """
 
+        if client is None:
+            async with create_openai_client() as client:
+                async for chunk in self.draft_response(incident, context, client):
+                    yield chunk
+            return
+
         prompt = self._build_prompt(incident, context)
 
-        response = _openai_client.responses.create(
+        buf = []
+        async with client.responses.stream(
             model="gpt-4.1-mini",
             input=prompt,
             temperature=0.2,
-        )
+        ) as stream:
+            async for event in stream:
+                if event.type == "response.output_text.delta":
+                    buf.append(event.delta)
+                    yield event.delta
 
-        # Extract plain text safely
-        response_text = response.output_text.strip()
+        response_text = "".join(buf).strip()
 
         # -------------------------------------------------
         # Lifecycle updates (TIME TO RESPONSE)
         # -------------------------------------------------
 
-        incident.mark_responded(response_text)
+        async with self._get_db_lock():
+            incident.mark_responded(response_text)
+            self.db.add(incident)
 
-        self.db.add(incident)
-        self.db.commit()
+            # Incident update + ledger event in ONE commit
+            self.ledger.record_response_drafted(incident.id)
+            write = asyncio.ensure_future(
+                asyncio.to_thread(self._flush_and_commit)
+            )
+            try:
+                await asyncio.shield(write)
+            except asyncio.CancelledError:
+                # The thread can't be cancelled: let it finish before
+                # unwinding so the caller never shares the Session with it
+                await write
+                raise
+
+    def _get_db_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._db_lock_loop is not loop:
+            self._db_lock = asyncio.Lock()
+            self._db_lock_loop = loop
+        return self._db_lock
+
+    def _flush_and_commit(self):
+        try:
+            self.ledger.flush()
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+    async def draft_responses(self, items) -> list:
+        """
+        Draft responses for many incidents concurrently.
+
+        `items` is an iterable of (incident, context) pairs.
+        Returns the full drafts in the same order.
+        If any draft fails, the others are cancelled and an
+        ExceptionGroup is raised.
+        """
 
-        self.ledger.record_response_drafted(incident.id)
+        async def _collect(client, incident, context):
+            return "".join(
+                [chunk async for chunk in self.draft_response(incident, context, client)]
+            ).strip()
 
-        return response_text
+        # One client (and pool) per burst, closed on this loop.
+        # TaskGroup cancels the other drafts on failure, before
+        # the client closes.
+        async with create_openai_client() as client:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(_collect(client, incident, context))
+                    for incident, context in items
+                ]
+
+        return [task.result() for task in tasks]
 
     # -----------------------------------------------------
     # Prompt construction (explicit & safe)
@@ -116,19 +213,10 @@ class LLMClient:
     def _build_prompt(self, incident, context: str) -> str:
         """
         Constructs a PR-safe, non-opinionated prompt.
+        Static prefix first, incident-specific tail last.
         """
 
-        return f"""
-You are assisting a professional public relations team.
-
-Your task:
-- Draft a calm, factual, non-defensive response
-- Do NOT speculate
-- Do NOT assign blame
-- Do NOT verify truth
-- Do NOT exaggerate
-- Keep it concise and professional
-
+        return SYSTEM_INSTRUCTIONS + f"""
 Incident details:
 - Title: {incident.title}
 - Source: {incident.source}
@@ -146,6 +234,7 @@ Draft a response that a PR team can review and approve.
 # =========================================================
 
 import json
+import orjson
 from openai import OpenAI
 from config import OPENAI_API_KEY, OPENAI_ORG_ID, OPENAI_PROJECT_ID
 
@@ -171,6 +260,9 @@ def call_chat(prompt: str, temperature: float = 0.2) -> str:
     return response.output_text.strip()
 
 
+_json_decoder = json.JSONDecoder()
+
+
 def parse_json_response(text: str):
     """
     Legacy JSON parser used by analyzer.
@@ -178,15 +270,15 @@ def parse_json_response(text: str):
     """
 
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        # Fallback: try to extract JSON block
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        # Fallback: decode the first complete JSON object in one pass
         start = text.find("{")
-        end = text.rfind("}")
-        if start != -1 and end != -1:
+        if start != -1:
             try:
-                return json.loads(text[start:end+1])
-            except Exception:
+                obj, _ = _json_decoder.raw_decode(text, start)
+                return obj
+            except json.JSONDecodeError:
                 pass
 
     return {
@@ -7,7 +7,9 @@ NEVER raises runtime errors.
 """
 
 from datetime import datetime
+from sqlalchemy import insert, update
 from models import (
+    Incident,
     INCIDENT_STATUS_OPEN,
     INCIDENT_STATUS_MONITORING,
 )
@@ -43,13 +45,81 @@ MIN_ALERT_RISK = "medium"
 MIN_ALERT_MENTIONS = 3
 
 
+# =========================================================
+# COLLECTOR PATH (NO DB)
+# =========================================================
+
+def score_from_engagement(likes=0, comments=0, shares=0):
+    """
+    Engagement-only scoring used by collectors.
+
+    ALWAYS returns: "low" | "medium" | "high"
+    """
+    mentions = (likes or 0) + (comments or 0) + (shares or 0)
+
+    if mentions >= 20:
+        return "high"
+    elif mentions >= 5:
+        return "medium"
+    return "low"
+
+
+# =========================================================
+# FULL PIPELINE PATH (DB + Post)
+# =========================================================
+
+def score_from_post(db, post):
+    """
+    Scores a stored Post and creates / escalates its Incident.
+    The caller commits.
+    """
+    mentions = (
+        (post.likes or 0)
+        + (post.comments or 0)
+        + (post.shares or 0)
+    )
+
+    incident = (
+        db.query(Incident)
+        .filter(Incident.title == post.text[:512])
+        .first()
+    )
+
+    # Simple escalation logic (safe)
+    escalate = mentions >= MIN_ALERT_MENTIONS
+
+    if not incident:
+        incident = Incident(
+            title=post.text[:512],
+            source=post.platform,
+            risk_level="low",
+            status=(
+                INCIDENT_STATUS_MONITORING if escalate
+                else INCIDENT_STATUS_OPEN
+            ),
+        )
+        db.add(incident)
+        db.flush()
+
+    # Targeted single-column UPDATE; the caller commits the batch.
+    elif escalate and incident.status != INCIDENT_STATUS_MONITORING:
+        db.execute(
+            update(Incident)
+            .where(Incident.id == incident.id)
+            .values(status=INCIDENT_STATUS_MONITORING)
+        )
+
+    return incident.risk_level
+
+
 # =========================================================
 # MAIN ENTRY (LEGACY SAFE)
 # =========================================================
 
 def score_priority(*args):
     """
-    Accepts ALL legacy call styles safely.
+    Deprecated variadic shim. Prefer score_from_engagement()
+    or score_from_post() directly.
 
     Supported:
     - score_priority(likes, comments, shares, text)
@@ -59,71 +129,99 @@ def score_priority(*args):
     ALWAYS returns: "low" | "medium" | "high"
     NEVER raises.
     """
-
-    # --------------------------------------------------
-    # LEGACY COLLECTOR PATH (NO DB)
-    # --------------------------------------------------
-    if len(args) in (3, 4):
-        likes = args[0] or 0
-        comments = args[1] or 0
-        shares = args[2] or 0 if len(args) == 4 else 0
-
-        mentions = likes + comments + shares
-
-        if mentions >= 20:
-            return "high"
-        elif mentions >= 5:
-            return "medium"
-        return "low"
-
-    # --------------------------------------------------
-    # FULL PIPELINE PATH (DB + Post)
-    # --------------------------------------------------
+    if len(args) == 4:
+        return score_from_engagement(args[0], args[1], args[2])
+    if len(args) == 3:
+        return score_from_engagement(args[0], args[1])
     if len(args) == 2:
-        db, post = args
+        return score_from_post(*args)
 
-        base_score = (
-            0.9 if post.priority.lower() == "high"
-            else 0.6 if post.priority.lower() == "medium"
-            else 0.3
-        )
+    # SAFETY FALLBACK
+    return "low"
+
+
+# =========================================================
+# BATCH ENTRY (DB + many Posts)
+# =========================================================
+
+def score_priority_batch(db, posts, existing=None):
+    """
+    Batch version of score_priority(db, post).
+
+    - ONE query to prefetch incidents by title
+    - ONE multi-row INSERT for new incidents
+    - ONE UPDATE for escalated incidents
+
+    `existing` is an optional {title: Incident} cache. Titles
+    missing from it are always looked up in the DB, and both
+    fetched and newly inserted incidents are added to it, so
+    it can be reused for the next batch (or started as {}).
+    Returns risk levels in the same order as `posts`.
+    The caller commits.
+    """
+    posts = list(posts)
+    if not posts:
+        return []
+
+    if existing is None:
+        existing = {}
+
+    missing = {p.text[:512] for p in posts} - existing.keys()
+    if missing:
+        # Ordered by id so a duplicated title resolves to its
+        # oldest incident, like score_from_post's .first()
+        for incident in (
+            db.query(Incident)
+            .filter(Incident.title.in_(missing))
+            .order_by(Incident.id.desc())
+        ):
+            existing[incident.title] = incident
 
+    new_rows = {}
+    escalate_ids = set()
+    levels = []
+
+    for post in posts:
+        title = post.text[:512]
         mentions = (
             (post.likes or 0)
             + (post.comments or 0)
             + (post.shares or 0)
         )
-
-        from models import Incident
-        from core.ledger import IncidentLedger
-
-        incident = (
-            db.query(Incident)
-            .filter(Incident.title == post.text[:512])
-            .first()
+        escalate = mentions >= MIN_ALERT_MENTIONS
+
+        incident = existing.get(title)
+        if incident is not None:
+            if escalate and incident.status != INCIDENT_STATUS_MONITORING:
+                escalate_ids.add(incident.id)
+            levels.append(incident.risk_level)
+            continue
+
+        row = new_rows.get(title)
+        if row is None:
+            row = new_rows[title] = {
+                "title": title,
+                "source": post.platform,
+                "risk_level": "low",
+                "status": INCIDENT_STATUS_OPEN,
+            }
+        if escalate:
+            row["status"] = INCIDENT_STATUS_MONITORING
+        levels.append(row["risk_level"])
+
+    if new_rows:
+        inserted = db.scalars(
+            insert(Incident).returning(Incident),
+            list(new_rows.values()),
+        )
+        for incident in inserted:
+            existing[incident.title] = incident
+
+    if escalate_ids:
+        db.execute(
+            update(Incident)
+            .where(Incident.id.in_(escalate_ids))
+            .values(status=INCIDENT_STATUS_MONITORING)
         )
 
-        if not incident:
-            incident = Incident(
-                title=post.text[:512],
-                source=post.platform,
-                risk_level="low",
-                status=INCIDENT_STATUS_OPEN,
-            )
-            db.add(incident)
-            db.commit()
-            db.refresh(incident)
-
-        # Simple escalation logic (safe)
-        if mentions >= MIN_ALERT_MENTIONS:
-            incident.status = INCIDENT_STATUS_MONITORING
-
-        db.add(incident)
-        db.commit()
-
-        return incident.risk_level
-
-    # --------------------------------------------------
-    # SAFETY FALLBACK
-    # --------------------------------------------------
-    return "low"
+    return levels
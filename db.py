@@ -1,16 +1,47 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import sessionmaker
 from models import Base
 
 # Setup SQLite Database
 DB_NAME = "neurochain.db"
-engine = create_engine(f"sqlite:///{DB_NAME}", echo=False)
+engine = create_engine(
+    f"sqlite:///{DB_NAME}",
+    echo=False,
+    insertmanyvalues_page_size=1000,  # multi-row VALUES for bulk inserts
+    # Room for several dashboard sessions + analyzer + LLM writes.
+    # (pre-ping / recycle are no-ops for a local SQLite file.)
+    pool_size=20,
+    max_overflow=10,
+)
 SessionLocal = sessionmaker(bind=engine)
 
 def init_db():
-    """Creates tables if they don't exist."""
+    """Creates tables and indexes if they don't exist."""
     Base.metadata.create_all(bind=engine)
 
+    # create_all skips indexes on tables that already exist,
+    # so add any newly declared ones to older databases.
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+    # Same for new nullable columns (existing rows get NULL)
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            have = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in have or not column.nullable:
+                    continue
+                col_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(
+                    f"ALTER TABLE {table.name} ADD COLUMN {column.name} {col_type}"
+                ))
+
+def pool_status():
+    """Connection pool summary, for debugging."""
+    return engine.pool.status()
+
 def get_db():
     """Dependency for database session."""
     db = SessionLocal()
@@ -7,9 +7,20 @@ INCIDENT_STATUS_MONITORING = "monitoring"
 INCIDENT_STATUS_RESPONDED = "responded"
 INCIDENT_STATUS_CLOSED = "closed"
 
+# =========================================================
+# Ledger hash format (see core.ledger.compute_hash)
+# =========================================================
+# NULL / 1 = legacy json.dumps({"prev": ..., "data": ...})
+# 2        = sha256(prev_bytes || orjson(data))
+
+LEDGER_HASH_VERSION_LEGACY = 1
+LEDGER_HASH_VERSION = 2
+
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey,Float
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey,Float, Index, func
 from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from datetime import datetime
 import json
 
@@ -65,20 +76,46 @@ class LedgerEntry(Base):
     timestamp = Column(DateTime, default=datetime.utcnow)
     hash = Column(String)
     prev_hash = Column(String, nullable=True)
+    hash_version = Column(Integer, nullable=True)  # NULL = legacy format
 
     debunk = relationship("Debunk", back_populates="ledger_entry")
 
 # --- DATA ACCESS HELPERS ---
+# Write helpers do NOT commit. They add + flush (so ids are available)
+# and the caller owns the transaction: either wrap the batch in
+# `with SessionLocal.begin() as db:` or call commit_batch(db) once at the end.
+
+def commit_batch(db):
+    """Commits everything added by the helpers below in one transaction."""
+    db.commit()
 
 def add_company(db, name, email):
     existing = db.query(Company).filter(Company.name == name).first()
     if not existing:
         comp = Company(name=name, email=email)
         db.add(comp)
-        db.commit()
+        db.flush()
         return comp
     return existing
 
+def add_companies(db, rows):
+    """
+    Bulk version of add_company: ONE statement for all rows.
+    rows = [{"name": ..., "email": ...}, ...]
+    Existing names are skipped (ON CONFLICT DO NOTHING).
+    Returns ids of the newly inserted companies.
+    """
+    if not rows:
+        return []
+    insert_fn = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    stmt = (
+        insert_fn(Company)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=["name"])
+        .returning(Company.id)
+    )
+    return db.execute(stmt).scalars().all()
+
 def get_all_companies(db):
     return db.query(Company).all()
 
@@ -97,12 +134,13 @@ def create_post(db, data: dict):
     if not existing:
         post = Post(**data)
         db.add(post)
-        db.commit()
-        db.refresh(post)
+        db.flush()
         return post
     return existing
 
 def get_unanalysed_posts(db):
+    # Returns a list, not a streaming cursor: the dashboard writes
+    # (via another session) while rendering these rows.
     return db.query(Post).filter(Post.analysed == False).order_by(Post.created_at.desc()).all()
 
 def get_unanalysed_posts_by_brand(db, brand):
@@ -126,8 +164,7 @@ def save_debunk(db, post_id, analysis_result):
             pr_response=analysis_result.get('pr_response', '')
         )
         db.add(debunk)
-        db.commit()
-        db.refresh(debunk)
+        db.flush()
         return debunk
     return None
 
@@ -135,16 +172,17 @@ def mark_email_sent(db, debunk_id):
     debunk = db.query(Debunk).filter(Debunk.id == debunk_id).first()
     if debunk:
         debunk.email_sent = True
-        db.commit()
+        db.flush()
 
-def create_ledger_entry(db, debunk_id, current_hash, prev_hash):
+def create_ledger_entry(db, debunk_id, current_hash, prev_hash, hash_version=LEDGER_HASH_VERSION):
     entry = LedgerEntry(
         debunk_id=debunk_id,
         hash=current_hash,
-        prev_hash=prev_hash
+        prev_hash=prev_hash,
+        hash_version=hash_version,
     )
     db.add(entry)
-    db.commit()
+    db.flush()
     return entry
 
 def get_last_ledger_entry(db):
@@ -162,6 +200,10 @@ def get_debunk_by_post_id(db, post_id):
 
 class Incident(Base):
     __tablename__ = "incidents"
+    __table_args__ = (
+        # Incidents are de-duplicated by title (see core.priority)
+        Index("ix_incidents_title", "title"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
 
@@ -202,11 +244,16 @@ class Incident(Base):
 
 class IncidentEvent(Base):
     __tablename__ = "incident_events"
+    __table_args__ = (
+        # Serves get_timeline: range scan on incident_id, already ordered by created_at
+        Index("ix_inc_events_incident_created", "incident_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    incident_id = Column(Integer, nullable=False)
+    incident_id = Column(Integer, ForeignKey("incidents.id"), nullable=False)
 
     event_type = Column(String(64), nullable=False)
     description = Column(Text, nullable=False)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
+    # Stamped by the DB; IncidentLedger also passes one timestamp per batch
+    created_at = Column(DateTime, server_default=func.now())
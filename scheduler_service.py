@@ -1,7 +1,7 @@
 import time
 import schedule
-from db import init_db, get_db
-from models import get_all_companies, get_unanalysed_posts_by_brand, save_debunk, mark_email_sent, create_ledger_entry, get_last_ledger_entry
+from db import init_db, get_db, SessionLocal
+from models import get_all_companies, get_unanalysed_posts_by_brand, save_debunk, mark_email_sent, create_ledger_entry, get_last_ledger_entry, commit_batch
 from collector_runner import collect_for_company
 from core.analyzer import extract_claim, search_evidence, analyze_claim
 from core.ledger import compute_hash
@@ -30,62 +30,69 @@ def watchdog_job():
     Checks DB for ANY unanalysed 'High' priority posts.
     This catches threats found by the auto-collector OR manual dashboard scans.
     """
-    db = next(get_db())
-    companies = get_all_companies(db)
+    with SessionLocal() as db:
+        companies = get_all_companies(db)
     
-    for company in companies:
-        # Get all unanalysed posts for this brand
-        posts = get_unanalysed_posts_by_brand(db, company.name)
+        for company in companies:
+            # Get all unanalysed posts for this brand
+            posts = get_unanalysed_posts_by_brand(db, company.name)
         
-        for post in posts:
-            # STRICT FILTER: Only act on HIGH priority
-            if post.priority != "High":
-                continue
+            for post in posts:
+                # STRICT FILTER: Only act on HIGH priority
+                if post.priority != "High":
+                    continue
 
-            print(f"\n⚡ [Watchdog] HIGH THREAT DETECTED (ID: {post.id})! Analyzing immediately...")
+                print(f"\n⚡ [Watchdog] HIGH THREAT DETECTED (ID: {post.id})! Analyzing immediately...")
             
-            try:
-                # 1. Extract Claim
-                claim = extract_claim(post.text)
-                if claim == "NO_CLAIM":
-                    # Mark as analysed (but empty) so we don't loop forever
-                    save_debunk(db, post.id, {"verdict": "Skipped", "explanation": "No claim extracted"})
-                    continue
+                # One commit per post. No write transaction is held open
+                # across LLM / SMTP calls, so other writers are not locked out.
+                try:
+                    # 1. Extract Claim
+                    claim = extract_claim(post.text)
+                    if claim == "NO_CLAIM":
+                        # Mark as analysed (but empty) so we don't loop forever
+                        save_debunk(db, post.id, {"verdict": "Skipped", "explanation": "No claim extracted"})
+                        commit_batch(db)
+                        continue
                     
-                # 2. Analyze
-                evidence = search_evidence(claim)
-                analysis = analyze_claim(claim, evidence, company.name)
+                    # 2. Analyze
+                    evidence = search_evidence(claim)
+                    analysis = analyze_claim(claim, evidence, company.name)
                 
-                if not isinstance(analysis, dict):
-                    continue
-                if 'claim' not in analysis: analysis['claim'] = claim
+                    if not isinstance(analysis, dict):
+                        continue
+                    if 'claim' not in analysis: analysis['claim'] = claim
 
-                # 3. Save to Ledger
-                debunk = save_debunk(db, post.id, analysis)
+                    # 3. Save to Ledger (committed BEFORE emailing)
+                    debunk = save_debunk(db, post.id, analysis)
                 
-                last_entry = get_last_ledger_entry(db)
-                prev = last_entry.hash if last_entry else "0"*64
-                create_ledger_entry(db, debunk.id, compute_hash(prev, {"id": debunk.id}), prev)
+                    last_entry = get_last_ledger_entry(db)
+                    prev = last_entry.hash if last_entry else "0"*64
+                    create_ledger_entry(db, debunk.id, compute_hash(prev, {"id": debunk.id}), prev)
+                    commit_batch(db)
                 
-                # 4. Email (Only if verdict is bad)
-                if debunk.verdict in ["False", "Misleading"]:
-                    print(f"   🚨 Verdict is {debunk.verdict}. Sending Email to {company.email}...")
-                    success = send_alert_email(
-                        to_email=company.email,
-                        company_name=company.name,
-                        post_url=post.url,
-                        claim=claim,
-                        verdict=debunk.verdict,
-                        explanation=debunk.explanation,
-                        pr_response=debunk.pr_response
-                    )
-                    if success:
-                        mark_email_sent(db, debunk.id)
-                else:
-                    print(f"   ℹ️ Verdict is {debunk.verdict}. No email sent.")
+                    # 4. Email (Only if verdict is bad)
+                    if debunk.verdict in ["False", "Misleading"]:
+                        print(f"   🚨 Verdict is {debunk.verdict}. Sending Email to {company.email}...")
+                        success = send_alert_email(
+                            to_email=company.email,
+                            company_name=company.name,
+                            post_url=post.url,
+                            claim=claim,
+                            verdict=debunk.verdict,
+                            explanation=debunk.explanation,
+                            pr_response=debunk.pr_response
+                        )
+                        if success:
+                            mark_email_sent(db, debunk.id)
+                            commit_batch(db)
+                    else:
+                        print(f"   ℹ️ Verdict is {debunk.verdict}. No email sent.")
                     
-            except Exception as e:
-                print(f"   ❌ Error processing post {post.id}: {e}")
+                except Exception as e:
+                    # Clear the failed transaction so later posts still work
+                    db.rollback()
+                    print(f"   ❌ Error processing post {post.id}: {e}")
 
 # --- MAIN LOOP ---
 init_db()